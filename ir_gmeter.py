@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 # iRacing G‑meter (G‑ball) overlay
-# Dependencies: pyirsdk, PyQt5
+# Dependencies: pyirsdk, PyQt5, numpy (optional: orjson)
 # MIT License
 
 import math
 import sys
 import time
 import json
+from math import cos, isnan, sin  # skips the math.<name> attribute lookup per call
 from pathlib import Path
-from collections import deque
+
+import numpy as np
 
 # --- Telemetry ---
 try:
@@ -20,67 +22,150 @@ except Exception as e:
 # --- UI ---
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-G0 = 9.80665  # m/s^2
+# --- Config I/O: orjson when available, stdlib json otherwise ---
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
 
-def ema(prev, new, alpha):
-    if prev is None:
-        return new
-    return alpha * new + (1 - alpha) * prev
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+G0 = 9.80665  # m/s^2
+_INV_G0 = 1.0 / G0
+_NAN = math.nan
+TRAIL_LEN = 120  # ~2s tail at 60Hz
+_TRIG_EPS = 1e-4  # rad; smaller pitch/roll changes reuse the cached trig terms
+TICK_MS = 16         # telemetry poll interval while connected (~60 Hz)
+RECONNECT_MS = 1000  # startup() retry interval while disconnected
 
 class IRacingReader(QtCore.QObject):
-    """Thin wrapper around pyirsdk for safe periodic reads."""
+    """Thin wrapper around pyirsdk for safe periodic reads.
+
+    Meant to live on its own QThread: freeze_var_buffer_latest() blocks until
+    the sim publishes a new frame, which must not stall the GUI event loop.
+    """
     telemetry = QtCore.pyqtSignal(float, float, float, float)  # long[m/s2], lat[m/s2], pitch[rad], roll[rad]
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ir = irsdk.IRSDK()
         self.connected = False
+        # Telemetry variable names, resolved once per connection
+        self._long_key = None
+        self._lat_key = None
+        self._pitch_key = None
+        self._roll_key = None
+        self._timer = None  # created by start() on the reader thread
+        self._paused = False
+
+    @QtCore.pyqtSlot()
+    def start(self):
         self._timer = QtCore.QTimer(self)
         self._timer.timeout.connect(self._tick)
-        self._timer.start(16)  # ~60 Hz UI tick; pyirsdk blocks for a new frame on freeze_var_buffer_latest()
+        if not self._paused:
+            self._timer.start(TICK_MS)  # ~60 Hz; pyirsdk blocks for a new frame on freeze_var_buffer_latest()
+
+    @QtCore.pyqtSlot()
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+        try:
+            self.ir.shutdown()
+        except Exception:
+            pass
+        self.connected = False
+
+    @QtCore.pyqtSlot()
+    def pause(self):
+        self._paused = True
+        if self._timer is not None:
+            self._timer.stop()
+
+    @QtCore.pyqtSlot()
+    def resume(self):
+        self._paused = False
+        if self._timer is not None and not self._timer.isActive():
+            self._timer.start()
+
+    def _set_interval(self, ms):
+        # setInterval() restarts an active timer, so only touch it on a change
+        if self._timer.interval() != ms:
+            self._timer.setInterval(ms)
 
     def _ensure_connected(self):
         if not self.connected:
             try:
                 self.ir.startup()
                 self.connected = self.ir.is_initialized and self.ir.is_connected
+                if self.connected:
+                    # Prefer high‑rate _ST variables if present; fall back otherwise
+                    self._long_key  = self._resolve_key('LongAccel_ST', 'LongAccel')
+                    self._lat_key   = self._resolve_key('LatAccel_ST', 'LatAccel')
+                    self._pitch_key = self._resolve_key('Pitch')  # rad
+                    self._roll_key  = self._resolve_key('Roll')   # rad
             except Exception:
                 self.connected = False
 
+    def _resolve_key(self, *names):
+        """Return the first of `names` the sim exposes, or None."""
+        for name in names:
+            if name in self.ir:
+                return name
+        return None
+
+    def _disconnect(self):
+        try:
+            self.ir.shutdown()
+        except Exception:
+            pass
+        self.connected = False
+        self._set_interval(RECONNECT_MS)
+        self.telemetry.emit(_NAN, _NAN, 0.0, 0.0)
+
     def _tick(self):
         try:
-            self._ensure_connected()
-            if not (self.connected and self.ir.is_connected):
-                self.telemetry.emit(float('nan'), float('nan'), 0.0, 0.0)
+            if not self.connected:
+                self._ensure_connected()
+                if not self.connected:
+                    # Back off while there is no sim instead of polling at 60 Hz
+                    self._set_interval(RECONNECT_MS)
+                    self.telemetry.emit(_NAN, _NAN, 0.0, 0.0)
+                    return
+                self._set_interval(TICK_MS)
+
+            ir = self.ir
+            # pyirsdk keeps its mapping open after the sim leaves, so reads would
+            # not fail; this is the one liveness check per tick.
+            if not ir.is_connected:
+                self._disconnect()
                 return
 
             # Get the latest consistent frame
-            self.ir.freeze_var_buffer_latest()
-
-            # Prefer high‑rate _ST variables if present; fall back otherwise
-            def getvar(name, fallback=None):
-                if name in self.ir:
-                    return float(self.ir[name])
-                if fallback and fallback in self.ir:
-                    return float(self.ir[fallback])
-                return float('nan')
+            ir.freeze_var_buffer_latest()
 
-            long_ms2 = getvar('LongAccel_ST', 'LongAccel')
-            lat_ms2  = getvar('LatAccel_ST',  'LatAccel')
-            pitch    = getvar('Pitch')  # rad
-            roll     = getvar('Roll')   # rad
+            long_ms2 = float(ir[self._long_key])  if self._long_key  else _NAN
+            lat_ms2  = float(ir[self._lat_key])   if self._lat_key   else _NAN
+            pitch    = float(ir[self._pitch_key]) if self._pitch_key else _NAN
+            roll     = float(ir[self._roll_key])  if self._roll_key  else _NAN
 
             self.telemetry.emit(long_ms2, lat_ms2, pitch, roll)
         except Exception:
             # If anything goes wrong (e.g., sim closed), mark as disconnected and keep trying
-            try:
-                self.ir.shutdown()
-            except Exception:
-                pass
-            self.connected = False
-            self.telemetry.emit(float('nan'), float('nan'), 0.0, 0.0)
+            self._disconnect()
 
 class GMeterOverlay(QtWidgets.QWidget):
+    # Reader control; queued onto the reader thread
+    _pause_reader = QtCore.pyqtSignal()
+    _resume_reader = QtCore.pyqtSignal()
+
     def __init__(self, config: dict):
         super().__init__()
         # Window flags: frameless, always on top, transparent background
@@ -95,7 +180,9 @@ class GMeterOverlay(QtWidgets.QWidget):
 
         # State (from config)
         self.g_scale = float(config.get('g_scale', 2.0))     # outer ring = ±g_scale
+        self._inv_scale = 1.0 / self.g_scale
         self.alpha = float(max(0.05, min(0.95, config.get('alpha', 0.25))))  # EMA smoothing
+        self._one_minus_alpha = 1.0 - self.alpha
         self.use_comp = bool(config.get('use_comp', False))  # gravity compensation
         self.show_trail = bool(config.get('show_trail', True))
         self.show_help = bool(config.get('show_help', False))
@@ -104,18 +191,56 @@ class GMeterOverlay(QtWidgets.QWidget):
 
         self._s_long_g = None
         self._s_lat_g = None
+        self._trig_at = None  # (pitch, roll) the cached trig terms were computed at
+        self._sin_p = self._cos_p = self._sin_r = 0.0
         self._last_pos = None
-        self._trail = deque(maxlen=120)  # ~2s tail at 60Hz
+        self._shown = None  # (dot px, dot py, readout digits) at the last scheduled repaint
+        self._idle_ticks = 0
+        self._dyn_rect = None  # last repainted trail+dot bounds; None forces a full repaint
         self._drag_origin = None
-
-        # Telemetry reader
+        self._bg_pix = None  # cached static chrome (halo, rings, crosshairs, label, help)
+
+        # Paint resources, built once and reused every frame
+        self._color_bg = QtGui.QColor(*self.bg_color)
+        self._pen_halo = QtGui.QPen(QtGui.QColor(255, 255, 255, 180), 2)
+        self._pen_grid = QtGui.QPen(QtGui.QColor(255, 255, 255, 90), 1)
+        self._pen_trail = QtGui.QPen(QtGui.QColor(0, 200, 255, 120), 2)
+        self._pen_dot_outline = QtGui.QPen(QtGui.QColor(0, 0, 0, 120), 1)
+        self._brush_dot = QtGui.QBrush(QtGui.QColor(0, 200, 255, 220))
+        self._font = QtGui.QFont("Segoe UI", 9)
+        self._color_label = QtGui.QColor(255, 255, 255, 200)
+        self._color_readout = QtGui.QColor(255, 255, 255, 220)
+        self._color_hint = QtGui.QColor(255, 255, 255, 160)
+        self._dot_pix = None  # pre-rendered dot sprite, built on first paint
+        # Top-left origin for static text whose baseline sits at (10, 20)
+        self._text_origin = QtCore.QPointF(10, 20 - QtGui.QFontMetricsF(self._font).ascent())
+        self._hint_text = QtGui.QStaticText("Waiting for iRacing telemetry…")
+        self._readout_text = QtGui.QStaticText()  # re-laid out only when its digits change
+        self._readout_digits = None  # (long, lat) in 0.01 g steps
+
+        # Trail ring buffer of (lat_g, long_g); mapped to pixels at paint time
+        self._trail_xy = np.empty((TRAIL_LEN, 2), dtype=np.float32)
+        self._trail_head = 0  # next write slot
+        self._trail_len = 0   # number of valid points
+        self._trail_poly = QtGui.QPolygonF()  # reused between paints
+        self._trail_buf = None  # numpy view onto _trail_poly's points
+        self._update_mapping()
+
+        # Telemetry reader on its own thread; signals to/from it are queued
         self.reader = IRacingReader()
+        self._reader_thread = QtCore.QThread(self)
+        self.reader.moveToThread(self._reader_thread)
+        self._reader_thread.started.connect(self.reader.start)
+        self._reader_thread.finished.connect(self.reader.stop)
         self.reader.telemetry.connect(self._on_telemetry)
+        self._pause_reader.connect(self.reader.pause)
+        self._resume_reader.connect(self.reader.resume)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._stop_reader)
+        self._reader_thread.start()
 
-        # UI refresh
-        self._ui_timer = QtCore.QTimer(self)
-        self._ui_timer.timeout.connect(self.update)
-        self._ui_timer.start(16)
+    def _stop_reader(self):
+        self._reader_thread.quit()
+        self._reader_thread.wait()
 
     # ----- Input -----
     def mousePressEvent(self, e):
@@ -139,93 +264,207 @@ class GMeterOverlay(QtWidgets.QWidget):
         k = e.key()
         if k == QtCore.Qt.Key_G:
             self.use_comp = not self.use_comp
+            self._bg_pix = None
         elif k == QtCore.Qt.Key_T:
             self.show_trail = not self.show_trail
         elif k == QtCore.Qt.Key_H:
             self.show_help = not self.show_help
+            self._bg_pix = None
         elif k in (QtCore.Qt.Key_Plus, QtCore.Qt.Key_Equal):
             self.g_scale = min(5.0, self.g_scale + 0.25)
+            self._inv_scale = 1.0 / self.g_scale
+            self._bg_pix = None
         elif k in (QtCore.Qt.Key_Minus, QtCore.Qt.Key_Underscore):
             self.g_scale = max(0.5, self.g_scale - 0.25)
+            self._inv_scale = 1.0 / self.g_scale
+            self._bg_pix = None
         elif k == QtCore.Qt.Key_S:
             self.alpha = min(0.95, self.alpha + 0.05)
+            self._one_minus_alpha = 1.0 - self.alpha
+            self._bg_pix = None
         elif k == QtCore.Qt.Key_A:
             self.alpha = max(0.05, self.alpha - 0.05)
+            self._one_minus_alpha = 1.0 - self.alpha
+            self._bg_pix = None
+        self._dyn_rect = None
         self.update()
 
+    def showEvent(self, e):
+        self._resume_reader.emit()
+        super().showEvent(e)
+
+    def hideEvent(self, e):
+        # Nothing to draw into while hidden; stop polling the sim
+        self._pause_reader.emit()
+        super().hideEvent(e)
+
+    def resizeEvent(self, e):
+        self._bg_pix = None
+        self._dyn_rect = None
+        self._update_mapping()
+        super().resizeEvent(e)
+
+    def _update_mapping(self):
+        """Cache the g-ball center and radius for the current widget size."""
+        w, h = self.width(), self.height()
+        self._cx, self._cy = w/2, h/2
+        self._radius = min(w, h) * 0.45
+        # Band holding the numeric readout / waiting hint (baseline at y=20)
+        self._readout_rect = QtCore.QRect(0, 0, w, 20 + QtGui.QFontMetrics(self._font).descent() + 1)
+
     # ----- Telemetry handling -----
     def _on_telemetry(self, long_ms2, lat_ms2, pitch, roll):
-        if math.isnan(long_ms2) or math.isnan(lat_ms2):
-            # No sim / no data
+        if isnan(long_ms2) or isnan(lat_ms2):
+            # No sim / no data; repaint once to show the waiting hint
+            had_data = self._last_pos is not None
             self._s_long_g = None
             self._s_lat_g = None
             self._last_pos = None
+            self._shown = None
+            self._readout_digits = None
+            self._dyn_rect = None
+            if had_data:
+                self.update()
             return
 
+        # Convert to g
+        long_g = long_ms2 * _INV_G0   # + forward, - braking
+        lat_g  = lat_ms2  * _INV_G0   # + left, - right
+
         # Optional gravity compensation.
         # iRacing’s LatAccel/LongAccel include gravity (docs & community lists).
         # Approximate removal of gravity component using body‑frame pitch/roll.
         # g_body = [-g*sin(pitch), -g*cos(pitch)*sin(roll), -g*cos(pitch)*cos(roll)]
-        if self.use_comp:
-            long_ms2 = long_ms2 + G0 * math.sin(pitch)
-            lat_ms2  = lat_ms2  + G0 * math.cos(pitch) * math.sin(roll)
-
-        # Convert to g
-        long_g = long_ms2 / G0   # + forward, - braking
-        lat_g  = lat_ms2  / G0   # + left, - right
-
-        # Smooth
-        self._s_long_g = ema(self._s_long_g, long_g, self.alpha)
-        self._s_lat_g  = ema(self._s_lat_g,  lat_g,  self.alpha)
+        # Applied in g units, so the G0 factor cancels out.
+        # Pitch/roll move slowly compared to the tick rate, so the trig is cached.
+        # A missing Pitch/Roll (NaN) skips compensation rather than poisoning the EMA.
+        if self.use_comp and not (isnan(pitch) or isnan(roll)):
+            at = self._trig_at
+            if at is None or abs(pitch - at[0]) >= _TRIG_EPS or abs(roll - at[1]) >= _TRIG_EPS:
+                self._trig_at = (pitch, roll)
+                self._sin_p = sin(pitch)
+                self._cos_p = cos(pitch)
+                self._sin_r = sin(roll)
+            long_g += self._sin_p
+            lat_g  += self._cos_p * self._sin_r
+
+        # Smooth (EMA, seeded with the first sample)
+        if self._s_long_g is None:
+            self._s_long_g = long_g
+            self._s_lat_g  = lat_g
+        else:
+            a, b = self.alpha, self._one_minus_alpha
+            self._s_long_g = a * long_g + b * self._s_long_g
+            self._s_lat_g  = a * lat_g  + b * self._s_lat_g
 
         # Store trail point in normalized coordinates (screen will map them)
-        if self._s_long_g is not None and self._s_lat_g is not None:
-            self._last_pos = (self._s_lat_g, self._s_long_g)  # (x=lat, y=long)
-            self._trail.append(self._last_pos)
+        self._last_pos = (self._s_lat_g, self._s_long_g)  # (x=lat, y=long)
+        head = self._trail_head
+        self._trail_xy[head] = self._last_pos
+        self._trail_head = (head + 1) % TRAIL_LEN
+        self._trail_len = min(TRAIL_LEN, self._trail_len + 1)
+
+        # Repaint only when the dot lands on another pixel or the readout digits
+        # change, or while the trail is still draining into the dot
+        digits = (round(self._s_long_g * 100), round(self._s_lat_g * 100))
+        if digits != self._readout_digits:
+            self._readout_digits = digits
+            self._readout_text.setText(f"Long: {digits[0] / 100:.2f} g   Lat: {digits[1] / 100:.2f} g")
+        k = self._radius * self._inv_scale
+        shown = (round(self._cx - self._s_lat_g * k), round(self._cy - self._s_long_g * k), digits)
+        if shown != self._shown:
+            self._shown = shown
+            self._idle_ticks = 0
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks > TRAIL_LEN or not self.show_trail:
+                return
 
-    # ----- Drawing -----
-    def paintEvent(self, _):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        # Invalidate only what changed: old and new trail+dot bounds plus the readout
+        rect = self._dynamic_rect()
+        if self._dyn_rect is None:
+            self.update()
+        else:
+            self.update(rect | self._dyn_rect | self._readout_rect)
+        self._dyn_rect = rect
+
+    def _dynamic_rect(self):
+        """Pixel bounds of the trail and dot for the current state."""
+        if self.show_trail and self._trail_len > 1:
+            # Valid points are always the first _trail_len slots; order is irrelevant
+            pts = self._trail_xy[:self._trail_len]
+            lat_min, long_min = pts.min(axis=0).tolist()
+            lat_max, long_max = pts.max(axis=0).tolist()
+        else:
+            lat_min = lat_max = self._s_lat_g
+            long_min = long_max = self._s_long_g
+        k = self._radius * self._inv_scale
+        m = 8  # dot radius + outline, also covers the trail pen
+        # Positive lat -> left, positive long -> up
+        return QtCore.QRectF(
+            QtCore.QPointF(self._cx - lat_max * k, self._cy - long_max * k),
+            QtCore.QPointF(self._cx - lat_min * k, self._cy - long_min * k),
+        ).adjusted(-m, -m, m, m).toAlignedRect()
+
+    def _trail_polygon(self, inv_scale_r):
+        """Map the ring buffer (oldest -> newest) to pixels straight into a QPolygonF."""
+        n = self._trail_len
+        poly = self._trail_poly
+        if poly.size() != n:
+            # Only while the ring is still filling up; afterwards the size is fixed
+            poly.fill(QtCore.QPointF(), n)
+            ptr = poly.data()
+            ptr.setsize(n * 2 * 8)  # QPointF is two qreal (double)
+            self._trail_buf = np.frombuffer(ptr, dtype=np.float64).reshape(n, 2)
+        buf = self._trail_buf
+        # Oldest -> newest is at most two contiguous slices of the ring
+        start = (self._trail_head - n) % TRAIL_LEN
+        first = min(n, TRAIL_LEN - start)
+        for dst, src in ((buf[:first], self._trail_xy[start:start + first]),
+                         (buf[first:], self._trail_xy[:n - first])):
+            # Positive lat -> left, positive long -> up
+            np.multiply(src, -inv_scale_r, out=dst)
+            dst += (self._cx, self._cy)
+        return poly
 
-        # Background
+    # ----- Drawing -----
+    def _render_background(self, p):
+        """Draw the static chrome; only re-run when scale/label/help/size change."""
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
         w, h = self.width(), self.height()
         center = QtCore.QPointF(w/2, h/2)
         radius = min(w, h) * 0.45
         if not self.testAttribute(QtCore.Qt.WA_TranslucentBackground):
-            r, g, b, a = self.bg_color
-            painter.fillRect(self.rect(), QtGui.QColor(r, g, b, a))
+            p.fillRect(self.rect(), self._color_bg)
 
         # Outer halo
-        pen_outer = QtGui.QPen(QtGui.QColor(255, 255, 255, 180), 2)
-        painter.setPen(pen_outer)
-        painter.drawEllipse(center, radius, radius)
+        p.setPen(self._pen_halo)
+        p.drawEllipse(center, radius, radius)
 
         # Grid rings at 0.5g increments
-        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255, 90), 1))
+        p.setPen(self._pen_grid)
         tick = 0.5
         r_step = radius * (tick / self.g_scale)
         g_ticks = int(self.g_scale / tick)
         for i in range(1, g_ticks):
             rr = r_step * i
-            painter.drawEllipse(center, rr, rr)
+            p.drawEllipse(center, rr, rr)
 
         # Crosshairs (use QPointF to avoid float->int overload issues)
-        painter.drawLine(
+        p.drawLine(
             QtCore.QPointF(center.x() - radius, center.y()),
             QtCore.QPointF(center.x() + radius, center.y())
         )  # lateral
-        painter.drawLine(
+        p.drawLine(
             QtCore.QPointF(center.x(), center.y() - radius),
             QtCore.QPointF(center.x(), center.y() + radius)
         )  # longitudinal
 
         # Labels
-        font = QtGui.QFont("Segoe UI", 9)
-        painter.setFont(font)
+        p.setFont(self._font)
         label = f"±{self.g_scale:.2f} g   α={self.alpha:.2f}   comp={'on' if self.use_comp else 'off'}"
-        painter.setPen(QtGui.QColor(255, 255, 255, 200))
-        painter.drawText(10, int(h - 10), label)
+        p.setPen(self._color_label)
+        p.drawText(10, int(h - 10), label)
 
         # Help
         if self.show_help:
@@ -239,44 +478,67 @@ class GMeterOverlay(QtWidgets.QWidget):
                     "Drag to move. Right‑click = quit.",
                     "Edit gmeter_config.json to change scale/smoothing/comp/trail.",
                 ]
+            p.setPen(self._color_label)
             y = 20
             for line in help_lines:
-                painter.drawText(10, y, line)
+                p.drawText(10, y, line)
                 y += 16
 
+    def _render_dot(self):
+        """Pre-render the antialiased dot (fill + outline) into a 14x14 sprite."""
+        dpr = self.devicePixelRatioF()
+        pix = QtGui.QPixmap(QtCore.QSize(14, 14) * dpr)
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(pix)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setBrush(self._brush_dot)
+        p.setPen(self._pen_dot_outline)
+        p.drawEllipse(QtCore.QPointF(7, 7), 6, 6)
+        p.end()
+        return pix
+
+    def paintEvent(self, _):
+        dpr = self.devicePixelRatioF()
+        # Also rebuild after moving to a screen with a different scale factor
+        if self._bg_pix is None or self._bg_pix.devicePixelRatio() != dpr:
+            self._bg_pix = QtGui.QPixmap(self.size() * dpr)
+            self._bg_pix.setDevicePixelRatio(dpr)
+            self._bg_pix.fill(QtCore.Qt.transparent)
+            bg_painter = QtGui.QPainter(self._bg_pix)
+            self._render_background(bg_painter)
+            bg_painter.end()
+
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pix)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setFont(self._font)
+
         # Dot and trail
         if self._last_pos is not None:
             # Map from (lat_g, long_g) to pixels; positive lat -> left, positive long -> up
+            inv_scale_r = self._radius * self._inv_scale
             lat_g, long_g = self._last_pos
-            x = center.x() - (lat_g / self.g_scale) * radius
-            y = center.y() - (long_g / self.g_scale) * radius
+            x = self._cx - lat_g * inv_scale_r
+            y = self._cy - long_g * inv_scale_r
 
             # Trail
-            if self.show_trail and len(self._trail) > 1:
-                path = QtGui.QPainterPath()
-                for i, (lat_i, long_i) in enumerate(self._trail):
-                    xi = center.x() - (lat_i / self.g_scale) * radius
-                    yi = center.y() - (long_i / self.g_scale) * radius
-                    if i == 0:
-                        path.moveTo(xi, yi)
-                    else:
-                        path.lineTo(xi, yi)
-                painter.setPen(QtGui.QPen(QtGui.QColor(0, 200, 255, 120), 2))
-                painter.drawPath(path)
+            if self.show_trail and self._trail_len > 1:
+                painter.setPen(self._pen_trail)
+                painter.drawPolyline(self._trail_polygon(inv_scale_r))
 
             # Dot
-            painter.setBrush(QtGui.QColor(0, 200, 255, 220))
-            painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0, 120), 1))
-            painter.drawEllipse(QtCore.QPointF(x, y), 6, 6)
+            if self._dot_pix is None or self._dot_pix.devicePixelRatio() != dpr:
+                self._dot_pix = self._render_dot()
+            painter.drawPixmap(QtCore.QPointF(x - 7, y - 7), self._dot_pix)
 
             # Numeric readout
-            painter.setPen(QtGui.QColor(255, 255, 255, 220))
-            painter.drawText(int(10), int(20),
-                             f"Long: {long_g:.2f} g   Lat: {lat_g:.2f} g")
+            painter.setPen(self._color_readout)
+            painter.drawStaticText(self._text_origin, self._readout_text)
         else:
             # No telemetry yet: show a hint
-            painter.setPen(QtGui.QColor(255, 255, 255, 160))
-            painter.drawText(int(10), int(20), "Waiting for iRacing telemetry…")
+            painter.setPen(self._color_hint)
+            painter.drawStaticText(self._text_origin, self._hint_text)
 
 def _default_config() -> dict:
     return {
@@ -296,12 +558,12 @@ def _load_config(path: Path) -> dict:
     if not path.exists():
         cfg = _default_config()
         try:
-            path.write_text(json.dumps(cfg, indent=2))
+            path.write_bytes(_json_dumps(cfg))
         except Exception:
             pass
         return cfg
     try:
-        return json.loads(path.read_text())
+        return _json_loads(path.read_bytes())
     except Exception:
         return _default_config()
 